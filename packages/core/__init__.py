@@ -10,7 +10,7 @@ from .schemas import (
     HealthResponse,
     MetaResponse,
 )
-from .version import VersionInfo, get_version_info
+from .version import VersionInfo, get_version_info, reset_version_cache
 
 __all__ = [
     "AppSettings",
@@ -24,5 +24,6 @@ __all__ = [
     "HealthResponse",
     "MetaResponse",
     "reset_settings_cache",
+    "reset_version_cache",
     "VersionInfo",
 ]
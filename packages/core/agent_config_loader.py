@@ -33,5 +33,9 @@ def load_agent_config_set(data: dict[str, Any]) -> AgentConfigSet:
 
 
 def load_agent_configs_from_list(items: list[dict[str, Any]]) -> AgentConfigSet:
-    """Convenience: validate a list of dicts into an ``AgentConfigSet``."""
-    return AgentConfigSet(agents=[AgentConfig.model_validate(d) for d in items])
+    """Convenience: validate a list of dicts into an ``AgentConfigSet``.
+
+    The whole list is validated in a single pydantic-core call; errors are
+    reported at ``agents.<index>.<field>``.
+    """
+    return AgentConfigSet.model_validate({"agents": items})
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
 from typing import Protocol
 
+from .clock import utc_now_iso
 from .contracts.agent_registry import AgentRegistration, AgentSpec
 
 
@@ -73,7 +73,7 @@ class InMemoryAgentRegistry(AgentRegistryABC):
         existing = self._agents.get(agent_name)
 
         if existing is None:
-            created_at = datetime.now(timezone.utc).isoformat()
+            created_at = utc_now_iso()
             registration = AgentRegistration(
                 spec=spec,
                 enabled=True,
@@ -97,7 +97,7 @@ class InMemoryAgentRegistry(AgentRegistryABC):
                 "Update the version to register a new specification."
             )
 
-        created_at = datetime.now(timezone.utc).isoformat()
+        created_at = utc_now_iso()
         updated = AgentRegistration(
             spec=spec,
             enabled=existing.enabled,
@@ -107,11 +107,16 @@ class InMemoryAgentRegistry(AgentRegistryABC):
         return updated
 
     def list_all(self, include_disabled: bool = False) -> list[AgentRegistration]:
-        agents = list(self._agents.values())
-        if not include_disabled:
-            agents = [registration for registration in agents if registration.enabled]
-
-        return sorted(agents, key=lambda registration: registration.spec.agent_name)
+        # _agents is keyed by agent_name, so sorting the keys gives the
+        # deterministic ordering without a per-item key function
+        agents = self._agents
+        names = sorted(agents)
+
+        if include_disabled:
+            return [agents[name] for name in names]
+        return [
+            registration for name in names if (registration := agents[name]).enabled
+        ]
 
     def get(self, agent_name: str) -> AgentRegistration | None:
         return self._agents.get(agent_name)
@@ -5,15 +5,17 @@ from __future__ import annotations
 import argparse
 import json
 from dataclasses import asdict
-from typing import Any, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Sequence
 
-from packages.core.agent_registry import InMemoryAgentRegistry
-from packages.core.contracts.agent_registry import AgentSpec
-from packages.core.contracts.tool_registry import ToolSpec
-from packages.core.services.meta_service import MetaService
-from packages.core.tool_registry import InMemoryToolRegistry
 from packages.core.version import get_version_info
 
+# Registries, contracts and services are imported inside the subcommands that
+# use them, so `flowbiz-core version` does not load the contracts package.
+if TYPE_CHECKING:
+    from packages.core.agent_registry import InMemoryAgentRegistry
+    from packages.core.tool_registry import InMemoryToolRegistry
+
 
 def _json_out(payload: Any) -> None:
     print(json.dumps(payload, indent=2, sort_keys=True))
@@ -26,6 +28,9 @@ def _text_out(title: str, items: dict[str, Any]) -> None:
 
 
 def _build_sample_agent_registry() -> InMemoryAgentRegistry:
+    from packages.core.agent_registry import InMemoryAgentRegistry
+    from packages.core.contracts.agent_registry import AgentSpec
+
     registry = InMemoryAgentRegistry()
     registry.register(
         AgentSpec(
@@ -48,6 +53,9 @@ def _build_sample_agent_registry() -> InMemoryAgentRegistry:
 
 
 def _build_sample_tool_registry() -> InMemoryToolRegistry:
+    from packages.core.contracts.tool_registry import ToolSpec
+    from packages.core.tool_registry import InMemoryToolRegistry
+
     registry = InMemoryToolRegistry()
     registry.register(
         ToolSpec(
@@ -84,6 +92,8 @@ def _handle_version(args: argparse.Namespace) -> int:
 
 
 def _handle_meta(args: argparse.Namespace) -> int:
+    from packages.core.services.meta_service import MetaService
+
     payload = MetaService().get_meta()
     if args.format == "json":
         _json_out(payload)
@@ -186,8 +196,14 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the CLI parser, built once per process (parsing never mutates it)."""
+    return build_parser()
+
+
 def main(argv: Sequence[str] | None = None) -> int:
-    parser = build_parser()
+    parser = _get_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     handler = getattr(args, "func", None)
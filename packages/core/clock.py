@@ -0,0 +1,12 @@
+"""UTC timestamp helper shared by the in-memory registries."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+_now = datetime.now
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string."""
+    return _now(UTC).isoformat()
@@ -181,7 +181,7 @@ class AppSettings(BaseSettings):
         )
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
     """Return cached application settings instance."""
 
@@ -53,6 +53,8 @@ class InMemoryAlertStore:
     def __init__(self) -> None:
         self._rules: dict[str, AlertRule] = {}
         self._events: list[AlertEvent] = []
+        # Firing events, kept alongside the history so firing() needs no scan
+        self._firing: list[AlertEvent] = []
 
     def add_rule(self, rule: AlertRule) -> None:
         self._rules[rule.name] = rule
@@ -71,6 +73,7 @@ class InMemoryAlertStore:
             value=value,
         )
         self._events.append(event)
+        self._firing.append(event)
         return event
 
     def resolve(self, rule_name: str) -> AlertEvent:
@@ -88,11 +91,12 @@ class InMemoryAlertStore:
         return list(self._events)
 
     def firing(self) -> list[AlertEvent]:
-        return [e for e in self._events if e.status == "firing"]
+        return list(self._firing)
 
     def clear(self) -> None:
         self._rules.clear()
         self._events.clear()
+        self._firing.clear()
 
 
 # ---------------------------------------------------------------------------
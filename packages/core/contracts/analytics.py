@@ -7,10 +7,12 @@ backends (Elasticsearch, ClickHouse, etc.) live outside core.
 
 from __future__ import annotations
 
+import heapq
 import time
-from typing import Literal
+from collections.abc import Iterable
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 # ---------------------------------------------------------------------------
 # PR-055 — Slow query tracking
@@ -100,6 +102,13 @@ class RequestLogEntry(BaseModel):
     metadata: dict[str, str] = Field(default_factory=dict)
 
 
+# Validates a whole record_bulk batch at once. Bulk durations are measured
+# elapsed times, so they must also be finite and non-negative.
+_DURATIONS_ADAPTER: TypeAdapter[list[float]] = TypeAdapter(
+    list[Annotated[float, Field(ge=0, allow_inf_nan=False)]]
+)
+
+
 class RequestAnalyticsSnapshot(BaseModel):
     """Aggregated request analytics."""
 
@@ -122,19 +131,63 @@ class InMemoryRequestAnalytics:
     def record(self, entry: RequestLogEntry) -> None:
         self._entries.append(entry)
 
+    def record_many(self, entries: Iterable[RequestLogEntry]) -> None:
+        """Append a batch of already-validated entries in one call."""
+        self._entries.extend(entries)
+
+    def record_bulk(
+        self,
+        method: RequestMethod,
+        path: str,
+        status_code: int,
+        durations: Iterable[float],
+    ) -> None:
+        """Record one entry per duration for requests sharing method/path/status.
+
+        The shared fields and the durations are each validated once; entries
+        are then assembled without re-validation and stamped with the same
+        timestamp. Bulk durations must be finite and non-negative.
+
+        Raises:
+            pydantic.ValidationError: If a shared field or any duration is
+                invalid; nothing is recorded in that case.
+        """
+        shared = RequestLogEntry(
+            method=method, path=path, status_code=status_code, duration_ms=0.0
+        )
+        validated = _DURATIONS_ADAPTER.validate_python(list(durations))
+        construct = RequestLogEntry.model_construct
+        self._entries.extend(
+            construct(
+                method=shared.method,
+                path=shared.path,
+                status_code=shared.status_code,
+                duration_ms=duration,
+                timestamp=shared.timestamp,
+            )
+            for duration in validated
+        )
+
     def snapshot(self) -> RequestAnalyticsSnapshot:
-        if not self._entries:
+        entries = self._entries
+        if not entries:
             return RequestAnalyticsSnapshot()
-        durations = sorted(e.duration_ms for e in self._entries)
-        error_count = sum(1 for e in self._entries if e.status_code >= 400)
-        avg_dur = sum(durations) / len(durations)
-        p95_idx = int(len(durations) * 0.95)
-        p95_dur = durations[min(p95_idx, len(durations) - 1)]
+        total = len(entries)
+        durations: list[float] = []
+        error_count = 0
         path_counts: dict[str, int] = {}
-        for e in self._entries:
+        for e in entries:
+            durations.append(e.duration_ms)
+            if e.status_code >= 400:
+                error_count += 1
             path_counts[e.path] = path_counts.get(e.path, 0) + 1
+        avg_dur = sum(durations) / total
+        # p95 is the value at sorted index p95_idx, i.e. the smallest of the
+        # top (total - p95_idx) durations; no need to sort the whole list.
+        p95_idx = min(int(total * 0.95), total - 1)
+        p95_dur = heapq.nlargest(total - p95_idx, durations)[-1]
         return RequestAnalyticsSnapshot(
-            total_requests=len(self._entries),
+            total_requests=total,
             error_count=error_count,
             avg_duration_ms=round(avg_dur, 2),
             p95_duration_ms=round(p95_dur, 2),
@@ -11,6 +11,7 @@ Actual enforcement (middleware, DB lookup) belongs in the platform layer.
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping, Sequence
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -87,20 +88,36 @@ class PrincipalRoles(BaseModel):
     roles: list[str] = Field(default_factory=list)
 
 
+def build_permission_index(
+    role_definitions: Sequence[RoleDefinition],
+) -> dict[str, frozenset[str]]:
+    """Map each role name to its permissions as a frozenset.
+
+    Build once and pass to :func:`check_permission` to reuse across many
+    checks. Later definitions of the same role name win.
+    """
+    return {r.role_name: frozenset(r.permissions) for r in role_definitions}
+
+
 def check_permission(
     principal_roles: PrincipalRoles,
-    role_definitions: list[RoleDefinition],
+    role_definitions: Sequence[RoleDefinition] | Mapping[str, frozenset[str]],
     required_permission: str,
 ) -> bool:
     """Check whether *principal_roles* grant *required_permission*.
 
     Returns True if any role assigned to the principal contains the
-    required permission string.
+    required permission string (or the ``"*"`` wildcard).
+    *role_definitions* may be a list of roles or an index prebuilt by
+    :func:`build_permission_index`.
     """
-    role_map = {r.role_name: set(r.permissions) for r in role_definitions}
+    if isinstance(role_definitions, Mapping):
+        role_map = role_definitions
+    else:
+        role_map = build_permission_index(role_definitions)
     for role_name in principal_roles.roles:
-        perms = role_map.get(role_name, set())
-        if required_permission in perms or "*" in perms:
+        perms = role_map.get(role_name)
+        if perms and (required_permission in perms or "*" in perms):
             return True
     return False
 
@@ -131,30 +148,38 @@ class RateLimitResult(BaseModel):
 
 
 class InMemoryRateLimiter:
-    """Simple in-memory sliding-window rate limiter stub.
+    """Simple in-memory token-bucket rate limiter stub.
+
+    Each key holds a bucket of ``requests_per_minute + burst`` tokens that
+    refills continuously at ``requests_per_minute / 60`` tokens per second;
+    a check spends one token.
 
     Production deployments should use Redis or a distributed store.
     """
 
+    __slots__ = ("_buckets", "_capacity", "_policy", "_rate")
+
     def __init__(self, policy: RateLimitPolicy | None = None) -> None:
         self._policy = policy or RateLimitPolicy(name="default")
-        self._windows: dict[str, list[float]] = {}
+        self._rate = self._policy.requests_per_minute / 60.0
+        self._capacity = float(self._policy.requests_per_minute + self._policy.burst)
+        # key -> (tokens, last refill time)
+        self._buckets: dict[str, tuple[float, float]] = {}
 
     def check(self, key: str) -> RateLimitResult:
         """Check whether *key* is within rate limits."""
         now = time.monotonic()
-        window_start = now - 60.0
-        hits = self._windows.setdefault(key, [])
-        # Prune old entries
-        hits[:] = [t for t in hits if t > window_start]
-        limit = self._policy.requests_per_minute + self._policy.burst
-        if len(hits) >= limit:
-            oldest_in_window = min(hits) if hits else now
-            retry_after = 60.0 - (now - oldest_in_window)
-            return RateLimitResult(
-                allowed=False,
-                remaining=0,
-                retry_after_seconds=max(retry_after, 0.0),
+        capacity = self._capacity
+        tokens, last = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - last) * self._rate)
+        if tokens < 1.0:
+            self._buckets[key] = (tokens, now)
+            retry_after = (1.0 - tokens) / self._rate if self._rate else 60.0
+            return RateLimitResult.model_construct(
+                allowed=False, remaining=0, retry_after_seconds=retry_after
             )
-        hits.append(now)
-        return RateLimitResult(allowed=True, remaining=limit - len(hits))
+        tokens -= 1.0
+        self._buckets[key] = (tokens, now)
+        return RateLimitResult.model_construct(
+            allowed=True, remaining=int(tokens), retry_after_seconds=0.0
+        )
@@ -245,6 +245,8 @@ class BillingWebhookPayload(BaseModel):
 class InMemoryOrgStore:
     """Stub organization store."""
 
+    __slots__ = ("_orgs",)
+
     def __init__(self) -> None:
         self._orgs: dict[str, Organization] = {}
 
@@ -264,26 +266,33 @@ class InMemoryOrgStore:
 class InMemoryUsageStore:
     """Stub usage tracking store."""
 
+    __slots__ = ("_by_org",)
+
     def __init__(self) -> None:
-        self._records: list[UsageRecord] = []
+        # Records bucketed by org_id so lookups skip other orgs' usage
+        self._by_org: dict[str, list[UsageRecord]] = {}
 
     def record(self, entry: UsageRecord) -> None:
-        self._records.append(entry)
+        self._by_org.setdefault(entry.org_id, []).append(entry)
 
     def records_for(self, org_id: str) -> list[UsageRecord]:
-        return [r for r in self._records if r.org_id == org_id]
+        return list(self._by_org.get(org_id, ()))
 
     def clear(self) -> None:
-        self._records.clear()
+        self._by_org.clear()
+
+
+# QuotaCheckResult is frozen, so the stub's one answer can be shared.
+_ALWAYS_ALLOWED = QuotaCheckResult(
+    allowed=True,
+    current_usage=0.0,
+    limit=float("inf"),
+    remaining=float("inf"),
+)
 
 
 class StubQuotaChecker:
     """Always-allow quota checker stub."""
 
     def check(self, org_id: str, resource: str, quantity: float) -> QuotaCheckResult:
-        return QuotaCheckResult(
-            allowed=True,
-            current_usage=0.0,
-            limit=float("inf"),
-            remaining=float("inf"),
-        )
+        return _ALWAYS_ALLOWED
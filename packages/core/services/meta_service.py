@@ -8,6 +8,8 @@ from packages.core import get_settings, get_version_info
 class MetaService:
     """Expose metadata about the running service."""
 
+    __slots__ = ("_settings",)
+
     def __init__(self) -> None:
         self._settings = get_settings()
 
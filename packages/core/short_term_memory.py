@@ -10,6 +10,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+_MISSING = object()
+
 
 class MemoryEntry(BaseModel):
     """A single memory entry."""
@@ -31,6 +33,8 @@ class MemorySnapshot(BaseModel):
 class ShortTermMemory:
     """In-memory key/value store for a single session."""
 
+    __slots__ = ("_data",)
+
     def __init__(self) -> None:
         self._data: dict[str, Any] = {}
 
@@ -44,10 +48,7 @@ class ShortTermMemory:
 
     def delete(self, key: str) -> bool:
         """Remove a key. Returns True if existed."""
-        if key in self._data:
-            del self._data[key]
-            return True
-        return False
+        return self._data.pop(key, _MISSING) is not _MISSING
 
     def keys(self) -> list[str]:
         """Return sorted list of keys."""
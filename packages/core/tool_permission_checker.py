@@ -6,12 +6,21 @@ persona policy and the tool's declared permission requirements.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from packages.core.tools.permissions import (
     AgentPolicy,
+    Permission,
     PolicyDecision,
     ToolPermissions,
 )
 
+# Permission members in reason-message order, so the deny branch can filter
+# instead of sorting.
+_PERMISSIONS_BY_VALUE: tuple[Permission, ...] = tuple(
+    sorted(Permission, key=lambda p: p.value)
+)
+
 
 def check_tool_permission(
     policy: AgentPolicy,
@@ -30,24 +39,51 @@ def check_tool_permission(
     3. Otherwise, allow.
 
     Returns a :class:`PolicyDecision` with *allowed* and a human-readable
-    *reason*.
+    *reason*.  Decisions are memoized per (persona, permissions, allowlist,
+    requirements, tool name), so repeated checks across turns are O(1).
+    """
+    return _decide(
+        policy.persona,
+        policy.allowed_permissions_mask,
+        policy.allowed_tools_set,
+        tool_permissions.required_permissions_mask,
+        tool_name,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _decide(
+    persona: str,
+    allowed_mask: int,
+    allowed_tools: frozenset[str],
+    required_mask: int,
+    tool_name: str,
+) -> PolicyDecision:
+    """Memoized decision over the hashable views of a policy and a tool.
+
+    Permissions are compared as bitmasks, so the subset test is one AND.
+
+    The key is built from views that the permission models recompute from
+    their fields on construction and on ``model_copy(update=...)``, so a
+    copied, narrowed policy gets its own key instead of the original's entry.
+
+    ``PolicyDecision`` is frozen, so cached instances are safe to share
+    across callers re-checking the same tool under the same persona.
     """
     # 1) Tool allowlist check
-    if policy.allowed_tools and tool_name not in policy.allowed_tools:
+    if allowed_tools and tool_name not in allowed_tools:
         return PolicyDecision(
             allowed=False,
-            reason=f"Tool '{tool_name}' is not in the allowlist for persona '{policy.persona}'",
+            reason=f"Tool '{tool_name}' is not in the allowlist for persona '{persona}'",
         )
 
-    # 2) Required permission check
-    allowed_set = set(policy.allowed_permissions)
-    missing = [
-        p.value for p in tool_permissions.required_permissions if p not in allowed_set
-    ]
-    if missing:
+    # 2) Required permission check (skipped entirely for permission-free tools)
+    missing_mask = required_mask & ~allowed_mask
+    if missing_mask:
+        missing = [p.value for p in _PERMISSIONS_BY_VALUE if missing_mask & p.bit]
         return PolicyDecision(
             allowed=False,
-            reason=f"Missing required permissions: {', '.join(sorted(missing))}",
+            reason=f"Missing required permissions: {', '.join(missing)}",
         )
 
     # 3) All checks passed
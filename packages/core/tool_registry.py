@@ -16,10 +16,10 @@ All operations are deterministic and produce stable, sorted results.
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+import sys
 from typing import Protocol
 
+from .clock import utc_now_iso
 from .contracts.tool_registry import ToolRegistration, ToolSpec
 
 
@@ -29,10 +29,8 @@ class ToolRegistryProtocol(Protocol):
     This protocol establishes the contract for tool registry implementations.
     All implementations must provide these methods with the specified behavior.
 
-    This module provides both Protocol (duck typing) and ABC (inheritance) patterns.
-    Use Protocol for maximum flexibility and duck typing support. Use ABC when
-    you need inheritance-based patterns or are working with frameworks that
-    expect inheritance.
+    Implementations conform structurally; no base class is required, which
+    keeps construction free of ABC bookkeeping.
     """
 
     def register(self, spec: ToolSpec) -> ToolRegistration:
@@ -110,50 +108,7 @@ class ToolRegistryProtocol(Protocol):
         ...
 
 
-class ToolRegistryABC(ABC):
-    """Abstract base class for Tool Registry implementations.
-
-    This ABC provides the same interface as ToolRegistryProtocol but can be
-    used with inheritance-based patterns if preferred over duck typing.
-
-    Prefer ABC over Protocol when:
-    - You need shared implementation methods in the base class
-    - You're working with frameworks that expect inheritance (e.g., dependency injection)
-    - You want explicit inheritance relationships for documentation or tooling
-
-    Prefer Protocol when:
-    - You want maximum flexibility and duck typing support
-    - You're implementing adapters for existing classes
-    - You want to avoid tight coupling through inheritance
-    """
-
-    @abstractmethod
-    def register(self, spec: ToolSpec) -> ToolRegistration:
-        """Register a tool with the given specification."""
-        ...
-
-    @abstractmethod
-    def list_all(self, include_disabled: bool = False) -> list[ToolRegistration]:
-        """List all registered tools."""
-        ...
-
-    @abstractmethod
-    def get(self, tool_name: str) -> ToolRegistration | None:
-        """Get a specific tool registration by name."""
-        ...
-
-    @abstractmethod
-    def set_enabled(self, tool_name: str, enabled: bool) -> ToolRegistration:
-        """Enable or disable a tool."""
-        ...
-
-    @abstractmethod
-    def remove(self, tool_name: str) -> None:
-        """Remove a tool from the registry."""
-        ...
-
-
-class InMemoryToolRegistry(ToolRegistryABC):
+class InMemoryToolRegistry:
     """In-memory implementation of Tool Registry.
 
     This implementation stores tool registrations in a dictionary keyed by tool_name.
@@ -176,6 +131,8 @@ class InMemoryToolRegistry(ToolRegistryABC):
         registration = registry.register(spec)
     """
 
+    __slots__ = ("_tools",)
+
     def __init__(self) -> None:
         """Initialize an empty in-memory tool registry."""
         self._tools: dict[str, ToolRegistration] = {}
@@ -205,12 +162,13 @@ class InMemoryToolRegistry(ToolRegistryABC):
                        but different specification. This includes the case where both
                        the existing and new specs have version=None (unversioned).
         """
-        tool_name = spec.tool_name
+        # Interned keys let later lookups with the same name short-circuit on identity
+        tool_name = sys.intern(spec.tool_name)
         existing = self._tools.get(tool_name)
 
         if existing is None:
             # New tool: create registration with current timestamp
-            created_at = datetime.now(timezone.utc).isoformat()
+            created_at = utc_now_iso()
             registration = ToolRegistration(
                 spec=spec, enabled=True, created_at=created_at
             )
@@ -218,17 +176,18 @@ class InMemoryToolRegistry(ToolRegistryABC):
             return registration
 
         # Tool exists: check if we can overwrite
-        if existing.spec == spec:
-            # Identical spec: return existing unchanged
+        existing_spec = existing.spec
+        if existing_spec is spec or existing_spec == spec:
+            # Identical spec (same object on idempotent re-register, or equal
+            # by value): return existing unchanged
             return existing
 
         # Different spec: check version
-        if existing.spec.version == spec.version:
+        new_version = spec.version
+        if existing_spec.version == new_version:
             # Same version, different spec: forbidden
             version_str = (
-                f"'{spec.version}'"
-                if spec.version is not None
-                else "None (unversioned)"
+                f"'{new_version}'" if new_version is not None else "None (unversioned)"
             )
             raise ValueError(
                 f"Cannot register tool '{tool_name}' with version {version_str}: "
@@ -238,7 +197,7 @@ class InMemoryToolRegistry(ToolRegistryABC):
 
         # Different version: overwrite with new registration
         # Preserve enabled state from existing registration
-        created_at = datetime.now(timezone.utc).isoformat()
+        created_at = utc_now_iso()
         registration = ToolRegistration(
             spec=spec, enabled=existing.enabled, created_at=created_at
         )
@@ -256,13 +215,14 @@ class InMemoryToolRegistry(ToolRegistryABC):
         Returns:
             List of tool registrations, sorted by tool_name
         """
-        tools = list(self._tools.values())
-
-        if not include_disabled:
-            tools = [t for t in tools if t.enabled]
-
-        # Sort by tool_name for stable, deterministic ordering
-        return sorted(tools, key=lambda t: t.spec.tool_name)
+        # _tools is keyed by tool_name, so sorting the keys gives the stable,
+        # deterministic ordering without a per-item key function
+        tools = self._tools
+        names = sorted(tools)
+
+        if include_disabled:
+            return [tools[name] for name in names]
+        return [t for name in names if (t := tools[name]).enabled]
 
     def get(self, tool_name: str) -> ToolRegistration | None:
         """Get a specific tool registration by name.
@@ -14,6 +14,9 @@ from .permissions import AgentPolicy, PolicyDecision
 
 __all__ = ["authorize"]
 
+# PolicyDecision is frozen, so the single stub decision is built once and shared.
+_ALLOW_DESIGN_ONLY = PolicyDecision(allowed=True, reason="design-only: not enforced")
+
 
 def authorize(tool: ToolBase, ctx: ToolContext, policy: AgentPolicy) -> PolicyDecision:
     """Authorize tool execution against a persona policy (design-only).
@@ -31,5 +34,4 @@ def authorize(tool: ToolBase, ctx: ToolContext, policy: AgentPolicy) -> PolicyDe
         PolicyDecision: Always an allow decision with a design-only reason.
     """
 
-    _ = (tool, ctx, policy)
-    return PolicyDecision(allowed=True, reason="design-only: not enforced")
+    return _ALLOW_DESIGN_ONLY
@@ -24,6 +24,8 @@ class ToolContext(BaseModel):
     trace_id: str
     agent_id: str
     intent: str | None = None
+    # frozen=True only blocks reassignment; the dicts stay mutable, so each
+    # instance needs its own empty default rather than a shared sentinel.
     params: dict[str, Any] = Field(default_factory=dict)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
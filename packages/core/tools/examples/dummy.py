@@ -20,6 +20,23 @@ from ..context import ToolContext
 from ..permissions import ToolPermissions
 from ..result import ToolError, ToolResult
 
+# ToolPermissions and ToolError are frozen, so the constant permission
+# declaration and error payloads are built once and shared.
+_NO_PERMISSIONS = ToolPermissions(
+    required_permissions=[],
+    optional_permissions=[],
+)
+_INVALID_PARAMS_ERROR = ToolError(
+    code="INVALID_PARAMS",
+    message="Params must be a dictionary",
+    retryable=False,
+)
+_EMPTY_PARAMS_ERROR = ToolError(
+    code="EMPTY_PARAMS",
+    message="No params provided",
+    retryable=False,
+)
+
 
 class DummyTool(ToolBase):
     """Echo tool that demonstrates proper Tool interface implementation.
@@ -68,10 +85,7 @@ class DummyTool(ToolBase):
         Note: This declaration is example-only and not enforced yet.
         Future PRs (PR-024, PR-030) will integrate permission checks.
         """
-        return ToolPermissions(
-            required_permissions=[],
-            optional_permissions=[],
-        )
+        return _NO_PERMISSIONS
 
     def run(self, context: ToolContext) -> ToolResult:
         """Execute the dummy echo tool.
@@ -84,38 +98,32 @@ class DummyTool(ToolBase):
         """
         # Validate params is dict-like
         if not isinstance(context.params, dict):
-            return ToolResult(
+            return ToolResult.build(
                 ok=False,
                 data=None,
-                error=ToolError(
-                    code="INVALID_PARAMS",
-                    message="Params must be a dictionary",
-                    retryable=False,
-                ),
+                error=_INVALID_PARAMS_ERROR,
                 trace_id=context.trace_id,
                 tool_name=self.name,
             )
 
         # Check for empty/falsy params
         if not context.params:
-            return ToolResult(
+            return ToolResult.build(
                 ok=False,
                 data=None,
-                error=ToolError(
-                    code="EMPTY_PARAMS",
-                    message="No params provided",
-                    retryable=False,
-                ),
+                error=_EMPTY_PARAMS_ERROR,
                 trace_id=context.trace_id,
                 tool_name=self.name,
             )
 
-        # Success path: echo params back
+        # Success path: echo params back without copying. The result shares the
+        # context's params dict (frozen=True does not make it immutable), so
+        # callers must treat the echoed mapping as read-only.
         echo_data: dict[str, Any] = {
             "echoed": context.params,
         }
 
-        return ToolResult(
+        return ToolResult.build(
             ok=True,
             data=echo_data,
             error=None,
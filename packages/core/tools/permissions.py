@@ -16,11 +16,21 @@ Design principles:
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable, Mapping
 from enum import Enum
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 
-__all__ = ["Permission", "ToolPermissions", "AgentPolicy", "PolicyDecision"]
+__all__ = [
+    "Permission",
+    "ToolPermissions",
+    "AgentPolicy",
+    "PolicyDecision",
+    "parse_permissions",
+    "permission_mask",
+]
 
 
 class Permission(str, Enum):
@@ -47,8 +57,58 @@ class Permission(str, Enum):
     DB_READ = "DB_READ"
     DB_WRITE = "DB_WRITE"
 
+    @property
+    def bit(self) -> int:
+        """Return this permission's single-bit flag for mask arithmetic."""
+        return _PERMISSION_BITS[self]
 
-class ToolPermissions(BaseModel):
+
+# One bit per member, in declaration order. The public value stays the string
+# name so serialized contracts are unchanged; masks are an internal index.
+_PERMISSION_BITS: dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
+
+
+def permission_mask(permissions: Iterable[Permission]) -> int:
+    """Fold *permissions* into an integer bitmask (duplicates are harmless)."""
+    mask = 0
+    for permission in permissions:
+        mask |= _PERMISSION_BITS[permission]
+    return mask
+
+
+# Building a TypeAdapter compiles a validator; do it once at import time.
+_PERMISSION_LIST_ADAPTER: TypeAdapter[list[Permission]] = TypeAdapter(list[Permission])
+
+
+def parse_permissions(data: list[str]) -> list[Permission]:
+    """Validate raw permission names (e.g. from JSON/YAML metadata).
+
+    Raises:
+        pydantic.ValidationError: If any entry is not a known permission.
+    """
+    return _PERMISSION_LIST_ADAPTER.validate_python(data)
+
+
+class _PrecomputedViewsModel(BaseModel):
+    """Base for frozen models that cache lookup views in ``model_post_init``.
+
+    ``model_copy(update=...)`` copies private attributes verbatim and skips
+    ``model_post_init``, so the views are rebuilt here to match the updated
+    fields. Without this a narrowed copy would keep the original grants.
+    """
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
+
+
+class ToolPermissions(_PrecomputedViewsModel):
     """Permission requirements declared by a tool.
 
     Tools declare what permissions they need through this schema.
@@ -80,8 +140,37 @@ class ToolPermissions(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    _required_permissions_set: frozenset[Permission] = PrivateAttr(
+        default_factory=frozenset
+    )
+    _optional_permissions_set: frozenset[Permission] = PrivateAttr(
+        default_factory=frozenset
+    )
+    _required_permissions_mask: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Precompute the permission sets and mask from the current fields."""
+        self._required_permissions_set = frozenset(self.required_permissions)
+        self._optional_permissions_set = frozenset(self.optional_permissions)
+        self._required_permissions_mask = permission_mask(self.required_permissions)
 
-class AgentPolicy(BaseModel):
+    @property
+    def required_permissions_set(self) -> frozenset[Permission]:
+        """Return ``required_permissions`` as a hashable frozenset."""
+        return self._required_permissions_set
+
+    @property
+    def optional_permissions_set(self) -> frozenset[Permission]:
+        """Return ``optional_permissions`` as a frozenset for O(1) membership checks."""
+        return self._optional_permissions_set
+
+    @property
+    def required_permissions_mask(self) -> int:
+        """Return ``required_permissions`` as a bitmask (see :attr:`Permission.bit`)."""
+        return self._required_permissions_mask
+
+
+class AgentPolicy(_PrecomputedViewsModel):
     """Permission policy for an agent persona.
 
     Defines what permissions an agent with a given persona is allowed to use.
@@ -118,6 +207,40 @@ class AgentPolicy(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    _allowed_permissions_set: frozenset[Permission] = PrivateAttr(
+        default_factory=frozenset
+    )
+    _allowed_tools_set: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _allowed_permissions_mask: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Precompute lookup sets and mask from the current fields.
+
+        Re-run by :meth:`model_copy` when fields are updated, so the views
+        always match ``allowed_permissions`` and ``allowed_tools``.
+
+        Tool names are interned so checks against registry keys (also interned)
+        compare by identity. Permission members are enum singletons already.
+        """
+        self._allowed_permissions_set = frozenset(self.allowed_permissions)
+        self._allowed_tools_set = frozenset(map(sys.intern, self.allowed_tools))
+        self._allowed_permissions_mask = permission_mask(self.allowed_permissions)
+
+    @property
+    def allowed_permissions_set(self) -> frozenset[Permission]:
+        """Return ``allowed_permissions`` as a frozenset for O(1) membership checks."""
+        return self._allowed_permissions_set
+
+    @property
+    def allowed_tools_set(self) -> frozenset[str]:
+        """Return ``allowed_tools`` as a frozenset for O(1) membership checks."""
+        return self._allowed_tools_set
+
+    @property
+    def allowed_permissions_mask(self) -> int:
+        """Return ``allowed_permissions`` as a bitmask (see :attr:`Permission.bit`)."""
+        return self._allowed_permissions_mask
+
 
 class PolicyDecision(BaseModel):
     """Result of an authorization check.
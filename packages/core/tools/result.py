@@ -22,6 +22,15 @@ class ToolError(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    @classmethod
+    def build(cls, code: str, message: str, retryable: bool = False) -> ToolError:
+        """Assemble a ToolError from trusted, already-typed values without validation.
+
+        Only for values produced by tool code itself. Anything crossing a
+        trust boundary must go through the normal constructor.
+        """
+        return cls.model_construct(code=code, message=message, retryable=retryable)
+
 
 class ToolResult(BaseModel):
     """Structured result from tool execution.
@@ -41,3 +50,23 @@ class ToolResult(BaseModel):
     tool_name: str
 
     model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def build(
+        cls,
+        ok: bool,
+        trace_id: str,
+        tool_name: str,
+        data: dict[str, Any] | None = None,
+        error: ToolError | None = None,
+    ) -> ToolResult:
+        """Assemble a ToolResult from trusted, already-typed values without validation.
+
+        Intended for a tool's own return sites, where ``trace_id`` comes from a
+        validated ToolContext and the remaining values are produced in code.
+        Anything crossing a trust boundary must go through the normal
+        constructor.
+        """
+        return cls.model_construct(
+            ok=ok, data=data, error=error, trace_id=trace_id, tool_name=tool_name
+        )
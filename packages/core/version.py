@@ -4,19 +4,29 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VersionInfo:
-    """Holds version and build metadata for the service."""
+    """Holds version and build metadata for the service.
+
+    Frozen because get_version_info() hands the same cached instance to
+    every caller.
+    """
 
     version: str
     git_sha: str
     build_time: str | None = None
 
 
+@lru_cache(maxsize=1)
 def get_version_info() -> VersionInfo:
-    """Return version information resolved from the environment."""
+    """Return cached version information resolved from the environment.
+
+    Build metadata is fixed for the lifetime of the process, so the
+    environment is read once.
+    """
 
     version = os.getenv("FLOWBIZ_VERSION") or os.getenv("APP_VERSION") or "dev"
     git_sha = (
@@ -36,3 +46,13 @@ def get_version_info() -> VersionInfo:
         git_sha=git_sha,
         build_time=build_time,
     )
+
+
+def reset_version_cache() -> None:
+    """Clear the version cache so new environment values are read.
+
+    Intended for testing scenarios where environment variables change
+    between assertions.
+    """
+
+    get_version_info.cache_clear()
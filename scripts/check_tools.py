@@ -9,14 +9,22 @@ Enforcement Layers:
 - Layer 2 (Recommended): Violations emit warnings only
 
 Usage:
-    python scripts/check_tools.py
+    python scripts/check_tools.py [--no-cache]
+
+Results for unchanged files are cached under .cache/check_tools/, keyed by
+file path, mtime, size and this script's own mtime.
 """
 
 from __future__ import annotations
 
+import argparse
 import ast
+import concurrent.futures
+import functools
+import hashlib
+import json
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 
@@ -26,25 +34,36 @@ ALLOWLIST_PATHS = [
     "packages/core/tools/__init__.py",
 ]
 
+# ALLOWLIST_PATHS as path components, matched as a prefix of each file's
+# repo-relative parts (no per-file string building)
+_ALLOWLIST_PARTS = tuple(Path(p).parts for p in ALLOWLIST_PATHS)
+
+# Base infrastructure files that never contain Tool implementations
+INFRASTRUCTURE_FILES = frozenset({"base.py", "context.py", "result.py", "__init__.py"})
+
 # Forbidden imports (runtime-level)
-FORBIDDEN_IMPORTS = {
-    "fastapi",
-    "apps.api",
-    "requests",  # unless infra-backed tool - not in this PR
-    "random",
-}
+FORBIDDEN_IMPORTS = frozenset(
+    {
+        "fastapi",
+        "apps.api",
+        "requests",  # unless infra-backed tool - not in this PR
+        "random",
+    }
+)
 
 # Forbidden function calls (module.function)
-FORBIDDEN_CALLS = {
-    "random.randint",
-    "random.random",
-    "random.choice",
-    "random.shuffle",
-    "datetime.datetime.now",
-    "datetime.now",
-    "os.getenv",
-    "os.environ.get",
-}
+FORBIDDEN_CALLS = frozenset(
+    {
+        "random.randint",
+        "random.random",
+        "random.choice",
+        "random.shuffle",
+        "datetime.datetime.now",
+        "datetime.now",
+        "os.getenv",
+        "os.environ.get",
+    }
+)
 
 # Forbidden module prefixes for isolation
 FORBIDDEN_MODULE_PREFIXES = [
@@ -52,8 +71,35 @@ FORBIDDEN_MODULE_PREFIXES = [
     "apps.api",
 ]
 
+# FORBIDDEN_MODULE_PREFIXES grouped by top-level package, so each import only
+# compares against prefixes sharing its first dotted segment
+_FORBIDDEN_ROOTS: dict[str, list[str]] = {}
+for _prefix in FORBIDDEN_MODULE_PREFIXES:
+    _FORBIDDEN_ROOTS.setdefault(_prefix.partition(".")[0], []).append(_prefix)
+del _prefix
+
+# Members every ToolBase subclass is checked for; all but run() are properties
+PROPERTY_TOOL_MEMBERS = frozenset({"name", "description", "version"})
+REQUIRED_TOOL_MEMBERS = ("name", "description", "version", "run")
+PROPERTY_DECORATORS = frozenset({"property", "abstractmethod"})
+
+# Below this many files, process-pool startup costs more than it saves
+PARALLEL_MIN_FILES = 4
 
-@dataclass
+# Per-file result cache, relative to the repository root
+CACHE_DIR = Path(".cache") / "check_tools"
+
+
+def is_forbidden_module(module_name: str) -> bool:
+    """Return True if module_name is, or lives under, a forbidden module prefix."""
+    candidates = _FORBIDDEN_ROOTS.get(module_name.partition(".")[0], ())
+    return any(
+        module_name == prefix or module_name.startswith(prefix + ".")
+        for prefix in candidates
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class Violation:
     """Represents a policy violation."""
 
@@ -64,7 +110,7 @@ class Violation:
     message: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     """Result of checking a tool file."""
 
@@ -73,8 +119,8 @@ class CheckResult:
     tool_classes: list[str]
 
 
-class ToolPolicyChecker(ast.NodeVisitor):
-    """AST visitor that checks tool policy rules."""
+class ToolPolicyChecker:
+    """AST checker that enforces tool policy rules."""
 
     def __init__(self, file_path: str):
         self.file_path = file_path
@@ -97,7 +143,49 @@ class ToolPolicyChecker(ast.NodeVisitor):
             )
         )
 
-    def visit_Import(self, node: ast.Import) -> None:
+    def check(self, tree: ast.AST) -> None:
+        """Check every node of *tree* in a single flat loop.
+
+        Nodes are visited in the same depth-first order ``ast.NodeVisitor``
+        would use, so violations are reported in the same order, but via an
+        explicit stack with ``isinstance`` dispatch instead of per-node method
+        lookup and recursion. Class and ``run()`` scopes push an exit marker
+        so their context is cleared after their children are checked.
+        """
+        stack: list[tuple[ast.AST, bool]] = [(tree, False)]
+        while stack:
+            node, exiting = stack.pop()
+            if exiting:
+                if isinstance(node, ast.ClassDef):
+                    self.current_class = None
+                else:
+                    self._exit_run_method(node)  # type: ignore[arg-type]
+                continue
+
+            if isinstance(node, ast.Call):
+                self._check_call(node)
+            elif isinstance(node, ast.Return):
+                self._check_return(node)
+            elif isinstance(node, ast.Import):
+                self._check_import(node)
+            elif isinstance(node, ast.ImportFrom):
+                self._check_import_from(node)
+            elif isinstance(node, ast.ClassDef):
+                self._check_class(node)
+                stack.append((node, True))
+            elif (
+                isinstance(node, ast.FunctionDef)
+                and node.name == "run"
+                and self.current_class
+            ):
+                self._enter_run_method(node)
+                stack.append((node, True))
+
+            children = list(ast.iter_child_nodes(node))
+            children.reverse()
+            stack.extend((child, False) for child in children)
+
+    def _check_import(self, node: ast.Import) -> None:
         """Check import statements."""
         for alias in node.names:
             module_name = alias.name
@@ -113,18 +201,15 @@ class ToolPolicyChecker(ast.NodeVisitor):
                 )
 
             # Check forbidden module prefixes
-            for prefix in FORBIDDEN_MODULE_PREFIXES:
-                if module_name.startswith(prefix):
-                    self.add_violation(
-                        node.lineno,
-                        "error",
-                        "forbidden-module",
-                        f"Tool must not import from: {module_name}",
-                    )
-
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+            if is_forbidden_module(module_name):
+                self.add_violation(
+                    node.lineno,
+                    "error",
+                    "forbidden-module",
+                    f"Tool must not import from: {module_name}",
+                )
+
+    def _check_import_from(self, node: ast.ImportFrom) -> None:
         """Check from...import statements."""
         if node.module:
             module_name = node.module
@@ -140,18 +225,15 @@ class ToolPolicyChecker(ast.NodeVisitor):
                 )
 
             # Check forbidden module prefixes
-            for prefix in FORBIDDEN_MODULE_PREFIXES:
-                if module_name.startswith(prefix):
-                    self.add_violation(
-                        node.lineno,
-                        "error",
-                        "forbidden-module",
-                        f"Tool must not import from: {module_name}",
-                    )
-
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+            if is_forbidden_module(module_name):
+                self.add_violation(
+                    node.lineno,
+                    "error",
+                    "forbidden-module",
+                    f"Tool must not import from: {module_name}",
+                )
+
+    def _check_class(self, node: ast.ClassDef) -> None:
         """Check class definitions for Tool implementations."""
         self.current_class = node.name
 
@@ -164,35 +246,29 @@ class ToolPolicyChecker(ast.NodeVisitor):
                 break
 
         if inherits_toolbase:
-            # Check required attributes
-            has_name = False
-            has_description = False
-            has_version = False
-            has_run_method = False
+            # Check required attributes in a single pass over the class body
+            found = dict.fromkeys(REQUIRED_TOOL_MEMBERS, False)
 
             for item in node.body:
-                # Check for property decorators
-                if isinstance(item, ast.FunctionDef):
-                    # Check if it's a property
-                    is_property = any(
-                        isinstance(dec, ast.Name) and dec.id == "property"
-                        for dec in item.decorator_list
-                    )
-                    is_abstractmethod = any(
-                        isinstance(dec, ast.Name) and dec.id == "abstractmethod"
+                if not isinstance(item, ast.FunctionDef):
+                    continue
+
+                if item.name == "run":
+                    found["run"] = True
+                elif item.name in PROPERTY_TOOL_MEMBERS:
+                    # Properties must be declared via @property or @abstractmethod
+                    decorators = {
+                        dec.id
                         for dec in item.decorator_list
-                    )
-
-                    if item.name == "name" and (is_property or is_abstractmethod):
-                        has_name = True
-                    elif item.name == "description" and (
-                        is_property or is_abstractmethod
-                    ):
-                        has_description = True
-                    elif item.name == "version" and (is_property or is_abstractmethod):
-                        has_version = True
-                    elif item.name == "run":
-                        has_run_method = True
+                        if isinstance(dec, ast.Name)
+                    }
+                    if not decorators.isdisjoint(PROPERTY_DECORATORS):
+                        found[item.name] = True
+
+            has_name = found["name"]
+            has_description = found["description"]
+            has_version = found["version"]
+            has_run_method = found["run"]
 
             # Report missing required attributes
             if not has_name:
@@ -234,54 +310,49 @@ class ToolPolicyChecker(ast.NodeVisitor):
                     f"Tool {node.name} should have a docstring",
                 )
 
-        self.generic_visit(node)
-        self.current_class = None
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Check function definitions, especially run() method."""
-        if node.name == "run" and self.current_class:
-            self.in_run_method = True
-            self.run_method_returns_tool_result = False
+    def _enter_run_method(self, node: ast.FunctionDef) -> None:
+        """Check the signature of a class's run() method."""
+        self.in_run_method = True
+        self.run_method_returns_tool_result = False
 
-            # Check return type annotation
-            if node.returns:
-                if isinstance(node.returns, ast.Name):
-                    if node.returns.id == "ToolResult":
-                        self.run_method_returns_tool_result = True
+        # Check return type annotation
+        if node.returns:
+            if isinstance(node.returns, ast.Name):
+                if node.returns.id == "ToolResult":
+                    self.run_method_returns_tool_result = True
 
-            # Check for type hints
-            if not node.returns:
-                self.add_violation(
-                    node.lineno,
-                    "warning",
-                    "missing-type-hint",
-                    "run() method should have return type annotation",
-                )
+        # Check for type hints
+        if not node.returns:
+            self.add_violation(
+                node.lineno,
+                "warning",
+                "missing-type-hint",
+                "run() method should have return type annotation",
+            )
 
-            # Check parameters
-            if len(node.args.args) < 2:  # self + context
-                self.add_violation(
-                    node.lineno,
-                    "error",
-                    "invalid-signature",
-                    "run() must accept 'context: ToolContext' parameter",
-                )
+        # Check parameters
+        if len(node.args.args) < 2:  # self + context
+            self.add_violation(
+                node.lineno,
+                "error",
+                "invalid-signature",
+                "run() must accept 'context: ToolContext' parameter",
+            )
 
-            self.generic_visit(node)
-            self.in_run_method = False
+    def _exit_run_method(self, node: ast.FunctionDef) -> None:
+        """Leave a run() method once its body has been checked."""
+        self.in_run_method = False
 
-            # After visiting, check if we found a ToolResult return
-            if not self.run_method_returns_tool_result:
-                self.add_violation(
-                    node.lineno,
-                    "warning",
-                    "missing-return-annotation",
-                    "run() should be annotated to return ToolResult",
-                )
-        else:
-            self.generic_visit(node)
+        # After visiting, check if we found a ToolResult return
+        if not self.run_method_returns_tool_result:
+            self.add_violation(
+                node.lineno,
+                "warning",
+                "missing-return-annotation",
+                "run() should be annotated to return ToolResult",
+            )
 
-    def visit_Return(self, node: ast.Return) -> None:
+    def _check_return(self, node: ast.Return) -> None:
         """Check return statements in run() method."""
         if self.in_run_method and node.value:
             # Check if returning a dict
@@ -293,9 +364,7 @@ class ToolPolicyChecker(ast.NodeVisitor):
                     "run() must return ToolResult, not dict",
                 )
 
-        self.generic_visit(node)
-
-    def visit_Call(self, node: ast.Call) -> None:
+    def _check_call(self, node: ast.Call) -> None:
         """Check function calls for forbidden operations."""
         # Build the full function name
         func_name = self._get_call_name(node.func)
@@ -308,19 +377,17 @@ class ToolPolicyChecker(ast.NodeVisitor):
                 f"Forbidden function call: {func_name}",
             )
 
-        self.generic_visit(node)
-
     def _get_call_name(self, node: ast.expr) -> str:
         """Extract the full name of a function call."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            if isinstance(node.value, ast.Name):
-                return f"{node.value.id}.{node.attr}"
-            elif isinstance(node.value, ast.Attribute):
-                base = self._get_call_name(node.value)
-                return f"{base}.{node.attr}"
-        return ""
+        # Walk the attribute chain iteratively and join once at the end
+        parts: list[str] = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return ""
+        parts.append(node.id)
+        return ".".join(reversed(parts))
 
 
 def check_tool_file(file_path: Path) -> CheckResult:
@@ -330,7 +397,7 @@ def check_tool_file(file_path: Path) -> CheckResult:
         tree = ast.parse(content, filename=str(file_path))
 
         checker = ToolPolicyChecker(str(file_path))
-        checker.visit(tree)
+        checker.check(tree)
 
         return CheckResult(
             file_path=str(file_path),
@@ -367,20 +434,69 @@ def check_tool_file(file_path: Path) -> CheckResult:
         )
 
 
-def is_allowlisted(file_path: Path, repo_root: Path) -> bool:
-    """Check if a file path is in the allowlist."""
-    relative_path = file_path.relative_to(repo_root)
-    path_str = str(relative_path)
+def _cache_key(file_path: Path) -> str:
+    """Build a cache key that changes whenever the file or this script changes."""
+    stat = file_path.stat()
+    script_mtime = Path(__file__).stat().st_mtime_ns
+    raw = f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}:{script_mtime}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def check_tool_file_cached(file_path: Path, cache_dir: Path | None) -> CheckResult:
+    """Check a tool file, reusing a cached result when the file is unchanged.
+
+    Passing cache_dir=None disables the cache. Cache read/write failures fall
+    back to a fresh check and never affect the result.
+    """
+    if cache_dir is None:
+        return check_tool_file(file_path)
+
+    try:
+        cache_file = cache_dir / f"{_cache_key(file_path)}.json"
+    except OSError:
+        return check_tool_file(file_path)
+
+    try:
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+        return CheckResult(
+            file_path=str(file_path),
+            violations=[Violation(**v) for v in payload["violations"]],
+            tool_classes=payload["tool_classes"],
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
 
-    for allowlist_path in ALLOWLIST_PATHS:
-        if path_str.startswith(allowlist_path) or path_str == allowlist_path:
-            return True
+    result = check_tool_file(file_path)
 
+    # Checker crashes may be transient; only cache real analysis results
+    if any(v.rule == "check-error" for v in result.violations):
+        return result
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "violations": [asdict(v) for v in result.violations],
+                    "tool_classes": result.tool_classes,
+                }
+            ),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+    return result
+
+
+def is_allowlisted(file_path: Path, repo_root: Path) -> bool:
+    """Check if a file path is in the allowlist."""
     # Skip __init__.py files
     if file_path.name == "__init__.py":
         return True
 
-    return False
+    rel_parts = file_path.relative_to(repo_root).parts
+    return any(rel_parts[: len(parts)] == parts for parts in _ALLOWLIST_PARTS)
 
 
 def find_tool_files(repo_root: Path) -> list[Path]:
@@ -390,17 +506,14 @@ def find_tool_files(repo_root: Path) -> list[Path]:
     if not tools_dir.exists():
         return []
 
-    # Exclude base infrastructure files
-    INFRASTRUCTURE_FILES = {"base.py", "context.py", "result.py", "__init__.py"}
-
     python_files = []
     for py_file in tools_dir.rglob("*.py"):
-        # Skip if allowlisted
-        if is_allowlisted(py_file, repo_root):
+        # Skip infrastructure files (cheap name check first)
+        if py_file.name in INFRASTRUCTURE_FILES:
             continue
 
-        # Skip infrastructure files
-        if py_file.name in INFRASTRUCTURE_FILES:
+        # Skip if allowlisted
+        if is_allowlisted(py_file, repo_root):
             continue
 
         python_files.append(py_file)
@@ -408,20 +521,21 @@ def find_tool_files(repo_root: Path) -> list[Path]:
     return python_files
 
 
-def print_violations(results: list[CheckResult]) -> tuple[int, int]:
-    """Print violations and return counts."""
+def format_violations(results: list[CheckResult]) -> tuple[int, int, list[str]]:
+    """Format violations as output lines and return counts alongside them."""
     error_count = 0
     warning_count = 0
+    lines: list[str] = []
 
     for result in results:
         if not result.violations:
             continue
 
-        print(f"\n{result.file_path}:")
+        lines.append(f"\n{result.file_path}:")
 
         for violation in result.violations:
             prefix = "ERROR" if violation.severity == "error" else "WARNING"
-            print(
+            lines.append(
                 f"  {prefix} [line {violation.line}] [{violation.rule}] {violation.message}"
             )
 
@@ -430,12 +544,21 @@ def print_violations(results: list[CheckResult]) -> tuple[int, int]:
             else:
                 warning_count += 1
 
-    return error_count, warning_count
+    return error_count, warning_count, lines
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Tool policy enforcement checker")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recheck every file instead of reusing cached results",
+    )
+    args = parser.parse_args(argv)
+
     repo_root = Path(__file__).parent.parent
+    cache_dir = None if args.no_cache else repo_root / CACHE_DIR
 
     print("=" * 70)
     print("Tool Policy Enforcement Check")
@@ -448,34 +571,45 @@ def main() -> int:
         print("\n✅ No tool files found to check.")
         return 0
 
-    print(f"\nChecking {len(tool_files)} tool file(s)...")
+    print(f"\nChecking {len(tool_files)} tool file(s)...", flush=True)
 
-    # Check each file
-    results = [check_tool_file(file_path) for file_path in tool_files]
+    # Check each file (independent, CPU-bound work: parse + AST walk)
+    check = functools.partial(check_tool_file_cached, cache_dir=cache_dir)
+    if len(tool_files) < PARALLEL_MIN_FILES:
+        results = [check(file_path) for file_path in tool_files]
+    else:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            results = list(executor.map(check, tool_files, chunksize=4))
 
-    # Print violations
-    error_count, warning_count = print_violations(results)
+    # Collect violations and summary, then emit them in a single write
+    error_count, warning_count, output = format_violations(results)
 
-    # Print summary
-    print("\n" + "=" * 70)
-    print("Summary")
-    print("=" * 70)
-    print(f"Files checked: {len(tool_files)}")
-    print(f"Errors: {error_count}")
-    print(f"Warnings: {warning_count}")
+    output += [
+        "\n" + "=" * 70,
+        "Summary",
+        "=" * 70,
+        f"Files checked: {len(tool_files)}",
+        f"Errors: {error_count}",
+        f"Warnings: {warning_count}",
+    ]
 
     if error_count > 0:
-        print("\n❌ Policy enforcement failed!")
-        print("   Fix the errors above before merging.")
-        return 1
-
-    if warning_count > 0:
-        print("\n⚠️  Policy check passed with warnings.")
-        print("   Consider addressing warnings for better code quality.")
+        output += [
+            "\n❌ Policy enforcement failed!",
+            "   Fix the errors above before merging.",
+        ]
+    elif warning_count > 0:
+        output += [
+            "\n⚠️  Policy check passed with warnings.",
+            "   Consider addressing warnings for better code quality.",
+        ]
     else:
-        print("\n✅ All checks passed!")
+        output.append("\n✅ All checks passed!")
+
+    sys.stdout.write("\n".join(output) + "\n")
+    sys.stdout.flush()
 
-    return 0
+    return 1 if error_count > 0 else 0
 
 
 if __name__ == "__main__":
@@ -22,12 +22,28 @@ Outputs to stdout in format:
     DETAILS_END
 """
 
-import json
 import os
 import re
 import sys
 from typing import List, Tuple
 
+# Use orjson's C parser for the (often large) GitHub event payload when it is
+# installed; the runner's stock python3 falls back to the stdlib parser.
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on runner environment
+    from json import loads as _json_loads
+
+ALLOWED_PERSONA_LABELS = frozenset({"persona:core", "persona:infra", "persona:docs"})
+
+# Required section headings, compiled once and matched in a single pass.
+# Accepts "Testing" and "Verification / Testing" variants.
+SECTION_HEADING_RE = re.compile(
+    r"^\s*#{1,3}\s*"
+    r"(?:(?P<summary>summary)|(?P<testing>testing|verification\s*/\s*testing))\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 def load_pr_data() -> Tuple[str, List[str]]:
     """Load PR body and labels from environment or GitHub event."""
@@ -47,8 +63,8 @@ def load_pr_data() -> Tuple[str, List[str]]:
     # Otherwise try GitHub event path
     event_path = os.environ.get("GITHUB_EVENT_PATH", "")
     if event_path and os.path.exists(event_path):
-        with open(event_path, "r", encoding="utf-8") as f:
-            event = json.load(f)
+        with open(event_path, "rb") as f:
+            event = _json_loads(f.read())
 
         pr_data = event.get("pull_request", {})
         if not pr_body:
@@ -66,8 +82,7 @@ def check_persona_label(labels: List[str]) -> Tuple[bool, str]:
     Returns:
         (missing, details) where missing=True if label is missing or multiple exist
     """
-    allowed_labels = ["persona:core", "persona:infra", "persona:docs"]
-    persona_labels = [label for label in labels if label in allowed_labels]
+    persona_labels = [label for label in labels if label in ALLOWED_PERSONA_LABELS]
 
     if len(persona_labels) == 0:
         return (
@@ -99,19 +114,20 @@ def check_pr_description(body: str) -> Tuple[bool, List[str]]:
     if not body.strip():
         return True, ["❌ PR description is empty. Use the PR template."]
 
-    # Check for Summary section
-    summary_pattern = re.compile(
-        r"^\s*#{1,3}\s*summary\b", re.IGNORECASE | re.MULTILINE
-    )
-    if not summary_pattern.search(body):
+    # Scan headings once, stopping as soon as both sections are seen
+    has_summary = has_testing = False
+    for match in SECTION_HEADING_RE.finditer(body):
+        if match.group("summary"):
+            has_summary = True
+        else:
+            has_testing = True
+        if has_summary and has_testing:
+            break
+
+    if not has_summary:
         issues.append("❌ Missing '## Summary' section")
 
-    # Check for Testing section (accept multiple variants)
-    testing_pattern = re.compile(
-        r"^\s*#{1,3}\s*(testing|verification\s*/\s*testing|verification/testing)\b",
-        re.IGNORECASE | re.MULTILINE,
-    )
-    if not testing_pattern.search(body):
+    if not has_testing:
         issues.append("❌ Missing '## Testing' or '## Verification / Testing' section")
 
     if issues:
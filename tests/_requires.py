@@ -1,10 +1,12 @@
 """Test requirement helpers."""
 
+import functools
 import importlib.util
 
 import pytest
 
 
+@functools.cache
 def has_httpx() -> bool:
     """Return True if httpx is installed."""
 
@@ -3,5 +3,41 @@ from pathlib import Path
 
 # Ensure repository root is importable when tests run without an installed package
 ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
+_ROOT_STR = str(ROOT_DIR)
+if _ROOT_STR not in sys.path:
+    sys.path.insert(0, _ROOT_STR)
+
+import pytest
+from apps.api.main import app as _app
+from packages.core.version import reset_version_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_version_info():
+    """Re-read version env vars per test; get_version_info caches per process."""
+
+    reset_version_cache()
+    yield
+    reset_version_cache()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The module-level FastAPI ``app``, imported once per test session."""
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Session-wide TestClient for the module-level ``app``.
+
+    The echo endpoints are stateless, so one client (and one lifespan cycle)
+    serves every test. Modules that need a freshly configured app build their
+    own from ``create_app()``.
+    """
+
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
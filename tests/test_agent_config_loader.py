@@ -116,3 +116,9 @@ class TestLoadFromList:
     def test_invalid_item_raises(self) -> None:
         with pytest.raises(ValidationError):
             load_agent_configs_from_list([{"agent_name": "z"}])  # missing persona
+
+    def test_invalid_item_error_location(self) -> None:
+        items = [{"agent_name": "a", "persona": "core"}, {"agent_name": "z"}]
+        with pytest.raises(ValidationError) as exc_info:
+            load_agent_configs_from_list(items)
+        assert exc_info.value.errors()[0]["loc"] == ("agents", 1, "persona")
@@ -4,9 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import pytest
-
-from apps.api.main import app
 from tests._requires import requires_httpx
 
 if TYPE_CHECKING:
@@ -15,13 +12,6 @@ if TYPE_CHECKING:
 pytestmark = [requires_httpx]
 
 
-@pytest.fixture
-def client() -> TestClient:
-    from fastapi.testclient import TestClient
-
-    return TestClient(app)
-
-
 def test_agent_run_endpoint_smoke(client: TestClient):
     """POST /v1/agent/run/legacy returns 200 and matches schema."""
 
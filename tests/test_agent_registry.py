@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import re
 
 import pytest
 from pydantic import ValidationError
@@ -15,6 +14,8 @@ from packages.core.contracts.agent_registry import (
     AgentSpec,
 )
 
+_ISO_UTC_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?\+00:00$")
+
 
 def test_agent_spec_round_trip_and_immutability() -> None:
     spec = AgentSpec(
@@ -27,7 +28,7 @@ def test_agent_spec_round_trip_and_immutability() -> None:
     dumped = spec.model_dump()
     loaded = AgentSpec.model_validate(dumped)
     assert loaded == spec
-    assert json.loads(json.dumps(dumped)) == dumped
+    assert AgentSpec.model_validate_json(spec.model_dump_json()) == spec
 
     with pytest.raises((ValidationError, AttributeError)):
         spec.agent_name = "changed"  # type: ignore[misc]
@@ -56,7 +57,7 @@ def test_register_get_and_sorted_list() -> None:
     assert retrieved is not None
     assert retrieved.spec.agent_name == "alpha"
     assert retrieved.created_at is not None
-    datetime.fromisoformat(retrieved.created_at)
+    assert _ISO_UTC_RE.match(retrieved.created_at)
 
 
 def test_register_same_version_different_spec_raises_value_error() -> None:
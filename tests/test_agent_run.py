@@ -4,9 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import pytest
-
-from apps.api.main import app
+from packages.core.runtime import RuntimeResult
 from tests._requires import requires_httpx
 
 if TYPE_CHECKING:
@@ -15,14 +13,6 @@ if TYPE_CHECKING:
 pytestmark = [requires_httpx]
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create test client for API."""
-    from fastapi.testclient import TestClient
-
-    return TestClient(app)
-
-
 def test_agent_run_echo_golden_path(client: TestClient):
     """POST /v1/agent/run with agent=echo returns ok with echoed input."""
 
@@ -183,6 +173,11 @@ def test_agent_run_response_schema_strict(client: TestClient):
     expected_keys = {"status", "trace_id", "agent", "output", "errors"}
     assert set(data.keys()) == expected_keys
 
+    # ...with the contract's types (RuntimeResult forbids extra keys)
+    result = RuntimeResult.model_validate(data)
+    assert result.status == "ok"
+    assert result.output == "schema test"
+
 
 def test_agent_run_meta_defaults(client: TestClient):
     """Verify meta field is optional with defaults."""
@@ -89,6 +89,19 @@ def test_default_agent_deterministic():
     assert "request_id" in result.trace
 
 
+def test_default_agent_result_matches_validated_model():
+    """Ensure the unvalidated fast path builds the same model as validation."""
+
+    ctx = AgentContext.create(input_text="hello", request_id="req-1")
+    result = DefaultAgent().run(ctx)
+
+    assert result == AgentResult.model_validate(result.model_dump())
+    assert result.model_dump_json() == (
+        '{"output_text":"OK: hello","status":"ok",'
+        '"trace":{"agent_name":"default","request_id":"req-1"}}'
+    )
+
+
 def test_agent_runtime_default_agent_ok():
     """Call runtime directly and assert deterministic output."""
 
@@ -68,6 +68,7 @@ class TestInMemoryAlertStore:
         store.clear()
         assert store.rules() == []
         assert store.events() == []
+        assert store.firing() == []
 
 
 class TestUptimeCheck:
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import pytest
 from packages.core.contracts.analytics import (
     InMemoryRequestAnalytics,
     InMemorySlowQueryTracker,
     RequestLogEntry,
     SlowQueryEntry,
 )
+from pydantic import TypeAdapter, ValidationError
+
+_ENTRY_LIST_ADAPTER = TypeAdapter(list[RequestLogEntry])
 
 
 class TestSlowQueryEntry:
@@ -85,15 +89,50 @@ class TestInMemoryRequestAnalytics:
 
     def test_p95(self) -> None:
         a = InMemoryRequestAnalytics()
-        for i in range(100):
-            a.record(
-                RequestLogEntry(
-                    method="GET", path="/x", status_code=200, duration_ms=float(i + 1)
-                )
-            )
+        a.record_bulk("GET", "/x", 200, range(1, 101))
         snap = a.snapshot()
+        assert snap.total_requests == 100
+        assert snap.requests_by_path == {"/x": 100}
         assert snap.p95_duration_ms >= 95.0
 
+    def test_record_many(self) -> None:
+        a = InMemoryRequestAnalytics()
+        raw = [
+            {"method": "GET", "path": "/x", "status_code": 200, "duration_ms": 1.0},
+            {"method": "POST", "path": "/y", "status_code": 500, "duration_ms": 2.0},
+        ]
+        a.record_many(_ENTRY_LIST_ADAPTER.validate_python(raw))
+        snap = a.snapshot()
+        assert snap.total_requests == 2
+        assert snap.error_count == 1
+
+    def test_record_bulk_validates_shared_fields(self) -> None:
+        a = InMemoryRequestAnalytics()
+        with pytest.raises(ValidationError):
+            a.record_bulk("FETCH", "/x", 200, [1.0])  # type: ignore[arg-type]
+        a.record_bulk("GET", "/x", 200, [2])
+        (entry,) = a.entries()
+        assert entry == RequestLogEntry(
+            method="GET",
+            path="/x",
+            status_code=200,
+            duration_ms=2.0,
+            timestamp=entry.timestamp,
+        )
+
+    @pytest.mark.parametrize(
+        "durations",
+        [[1.0, "slow"], [1.0, -5.0], [float("nan")], [None]],
+        ids=["not_a_number", "negative", "nan", "none"],
+    )
+    def test_record_bulk_rejects_invalid_durations(
+        self, durations: list[object]
+    ) -> None:
+        a = InMemoryRequestAnalytics()
+        with pytest.raises(ValidationError):
+            a.record_bulk("GET", "/x", 200, durations)  # type: ignore[arg-type]
+        assert a.entries() == []
+
     def test_clear(self) -> None:
         a = InMemoryRequestAnalytics()
         a.record(
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import pytest
-
-from apps.api.main import app
 from tests._requires import requires_httpx
 
 if TYPE_CHECKING:
@@ -13,13 +10,6 @@ if TYPE_CHECKING:
 pytestmark = [requires_httpx]
 
 
-@pytest.fixture
-def client() -> TestClient:
-    from fastapi.testclient import TestClient
-
-    return TestClient(app)
-
-
 def test_root_endpoint_returns_placeholder_message(client: TestClient):
     """Tests that the root endpoint returns the expected placeholder message."""
     response = client.get("/")
@@ -14,6 +14,7 @@ from packages.core.contracts.auth import (
     RateLimitResult,
     RoleDefinition,
     StubAPIKeyValidator,
+    build_permission_index,
     check_permission,
 )
 
@@ -79,6 +80,20 @@ class TestRBACContracts:
         principal = PrincipalRoles(principal_id="u1", roles=[])
         assert check_permission(principal, roles, "read") is False
 
+    def test_prebuilt_permission_index(self) -> None:
+        index = build_permission_index(
+            [
+                RoleDefinition(role_name="viewer", permissions=["read"]),
+                RoleDefinition(role_name="superadmin", permissions=["*"]),
+            ]
+        )
+        assert index["viewer"] == frozenset({"read"})
+        viewer = PrincipalRoles(principal_id="u1", roles=["viewer", "unknown"])
+        admin = PrincipalRoles(principal_id="u2", roles=["superadmin"])
+        assert check_permission(viewer, index, "read") is True
+        assert check_permission(viewer, index, "write") is False
+        assert check_permission(admin, index, "write") is True
+
 
 # ── Rate limiting (PR-044.13) ────────────────────────────────
 
@@ -112,6 +127,24 @@ class TestRateLimiting:
         result = limiter.check("b")
         assert result.allowed is True
 
+    def test_refills_over_time(self, monkeypatch) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "packages.core.contracts.auth.time.monotonic", lambda: clock[0]
+        )
+        policy = RateLimitPolicy(name="t", requests_per_minute=60, burst=0)
+        limiter = InMemoryRateLimiter(policy)
+        for _ in range(60):
+            assert limiter.check("user-1").allowed is True
+
+        blocked = limiter.check("user-1")
+        assert blocked.allowed is False
+        assert blocked.retry_after_seconds == pytest.approx(1.0)
+
+        clock[0] += 1.0  # one token refilled
+        assert limiter.check("user-1").allowed is True
+        assert limiter.check("user-1").allowed is False
+
     def test_result_schema(self) -> None:
         r = RateLimitResult(allowed=True, remaining=5)
         assert r.retry_after_seconds == 0.0
@@ -172,6 +172,18 @@ class TestInMemoryUsageStore:
         store.clear()
         assert store.records_for("o1") == []
 
+    def test_records_for_returns_copy_in_order(self) -> None:
+        store = InMemoryUsageStore()
+        first = UsageRecord(org_id="o1", resource="api", quantity=1, unit="request")
+        second = UsageRecord(org_id="o1", resource="api", quantity=2, unit="request")
+        store.record(first)
+        store.record(second)
+        records = store.records_for("o1")
+        assert records == [first, second]
+        records.clear()
+        assert store.records_for("o1") == [first, second]
+        assert store.records_for("missing") == []
+
 
 class TestStubQuotaChecker:
     def test_always_allows(self) -> None:
@@ -1,4 +1,4 @@
-import inspect
+from pathlib import Path
 
 from pydantic import BaseModel
 
@@ -73,13 +73,10 @@ def test_contract_models_are_frozen_and_forbid_extra():
 
 
 def test_contract_package_has_no_fastapi_dependency():
-    module_sources = [
-        inspect.getsource(contracts),
-        inspect.getsource(HealthResponse),
-        inspect.getsource(RuntimeMeta),
-        inspect.getsource(JobEnvelope),
-        inspect.getsource(ToolSpec),
-    ]
-    merged_source = "\n".join(module_sources)
+    # Scan whole module files, so module-level imports are covered too
+    package_dir = Path(contracts.__file__).parent
+    module_paths = sorted(package_dir.glob("*.py"))
+    assert module_paths
 
-    assert "fastapi" not in merged_source.lower()
+    for path in module_paths:
+        assert b"fastapi" not in path.read_bytes().lower(), path.name
@@ -42,6 +42,7 @@ from packages.core.contracts.meta import RuntimeMeta
             "transform",
         ),
     ],
+    ids=["health_response", "runtime_meta", "job_envelope"],
 )
 def test_schema_round_trip_and_immutability(
     schema_class: type[BaseModel],
@@ -28,35 +28,36 @@ class TestConversationContracts:
             s.conversation_id = "c2"  # type: ignore[misc]
 
 
+@pytest.fixture()
+def mgr() -> ConversationManager:
+    """A fresh manager per test; managers hold mutable turn history."""
+    return ConversationManager("c1")
+
+
 class TestConversationManager:
-    def test_add_turn(self) -> None:
-        mgr = ConversationManager("c1")
+    def test_add_turn(self, mgr: ConversationManager) -> None:
         t = mgr.add_turn("user", "hello")
         assert t.role == "user"
         assert t.content == "hello"
         assert mgr.turn_count == 1
 
-    def test_snapshot(self) -> None:
-        mgr = ConversationManager("c1")
+    def test_snapshot(self, mgr: ConversationManager) -> None:
         mgr.add_turn("user", "hi")
         mgr.add_turn("agent", "hello")
         snap = mgr.snapshot()
         assert snap.conversation_id == "c1"
         assert len(snap.turns) == 2
 
-    def test_metadata(self) -> None:
-        mgr = ConversationManager("c1")
+    def test_metadata(self, mgr: ConversationManager) -> None:
         t = mgr.add_turn("user", "x", source="web")
         assert t.metadata == {"source": "web"}
 
-    def test_clear(self) -> None:
-        mgr = ConversationManager("c1")
+    def test_clear(self, mgr: ConversationManager) -> None:
         mgr.add_turn("user", "x")
         mgr.clear()
         assert mgr.turn_count == 0
 
-    def test_multiple_snapshots_independent(self) -> None:
-        mgr = ConversationManager("c1")
+    def test_multiple_snapshots_independent(self, mgr: ConversationManager) -> None:
         mgr.add_turn("user", "a")
         snap1 = mgr.snapshot()
         mgr.add_turn("agent", "b")
@@ -1,35 +1,47 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import pytest
 from apps.api.main import create_app
+from packages.core import reset_settings_cache
 from tests._requires import requires_httpx
 
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
 pytestmark = [requires_httpx]
 
 
-def test_cors_simple_request_reflects_allowed_origin(monkeypatch):
+@pytest.fixture(scope="module")
+def cors_client() -> TestClient:
+    """One app built with a CORS origin configured, shared by this module.
+
+    Settings are only read inside ``create_app()``, so the environment and
+    settings cache are restored as soon as the app is built.
+    """
     from fastapi.testclient import TestClient
 
-    monkeypatch.setenv("APP_ENV", "test")
-    monkeypatch.setenv("APP_CORS_ALLOW_ORIGINS", "https://example.com")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("APP_ENV", "test")
+        mp.setenv("APP_CORS_ALLOW_ORIGINS", "https://example.com")
+        reset_settings_cache()
+        try:
+            app = create_app()
+        finally:
+            reset_settings_cache()
+
+    return TestClient(app)
 
-    app = create_app()
-    client = TestClient(app)
 
-    resp = client.get("/healthz", headers={"Origin": "https://example.com"})
+def test_cors_simple_request_reflects_allowed_origin(cors_client: TestClient):
+    resp = cors_client.get("/healthz", headers={"Origin": "https://example.com"})
     assert resp.status_code == 200
     assert resp.headers.get("access-control-allow-origin") == "https://example.com"
 
 
-def test_cors_preflight_options(monkeypatch):
-    from fastapi.testclient import TestClient
-
-    monkeypatch.setenv("APP_ENV", "test")
-    monkeypatch.setenv("APP_CORS_ALLOW_ORIGINS", "https://example.com")
-
-    app = create_app()
-    client = TestClient(app)
-
-    resp = client.options(
+def test_cors_preflight_options(cors_client: TestClient):
+    resp = cors_client.options(
         "/healthz",
         headers={
             "Origin": "https://example.com",
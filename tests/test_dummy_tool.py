@@ -3,21 +3,28 @@
 from __future__ import annotations
 
 import json
+from typing import Any
 
+import pytest
 from packages.core.tools import ToolContext
 from packages.core.tools.examples import DummyTool
 
 
-def test_dummy_tool_success_with_params():
+@pytest.fixture(scope="module")
+def dummy_tool() -> DummyTool:
+    """DummyTool is stateless, so one instance serves the whole module."""
+    return DummyTool()
+
+
+def test_dummy_tool_success_with_params(dummy_tool: DummyTool):
     """Test successful execution when params are provided."""
-    tool = DummyTool()
     context = ToolContext(
         trace_id="trace-dummy-001",
         agent_id="agent-test",
         params={"key1": "value1", "key2": 42, "nested": {"inner": "data"}},
     )
 
-    result = tool.run(context)
+    result = dummy_tool.run(context)
 
     assert result.ok is True
     assert result.error is None
@@ -32,16 +39,15 @@ def test_dummy_tool_success_with_params():
     }
 
 
-def test_dummy_tool_error_empty_params():
+def test_dummy_tool_error_empty_params(dummy_tool: DummyTool):
     """Test error path when params are empty."""
-    tool = DummyTool()
     context = ToolContext(
         trace_id="trace-dummy-002",
         agent_id="agent-test",
         params={},
     )
 
-    result = tool.run(context)
+    result = dummy_tool.run(context)
 
     assert result.ok is False
     assert result.data is None
@@ -53,9 +59,8 @@ def test_dummy_tool_error_empty_params():
     assert result.error.retryable is False
 
 
-def test_dummy_tool_trace_id_propagation():
+def test_dummy_tool_trace_id_propagation(dummy_tool: DummyTool):
     """Test that trace_id is correctly propagated to result."""
-    tool = DummyTool()
     test_trace_id = "custom-trace-xyz-789"
     context = ToolContext(
         trace_id=test_trace_id,
@@ -63,36 +68,47 @@ def test_dummy_tool_trace_id_propagation():
         params={"test": "data"},
     )
 
-    result = tool.run(context)
+    result = dummy_tool.run(context)
 
     assert result.trace_id == test_trace_id
 
 
-def test_dummy_tool_name_is_correct():
+def test_dummy_tool_name_is_correct(dummy_tool: DummyTool):
     """Test that tool_name is correctly set in result."""
-    tool = DummyTool()
     context = ToolContext(
         trace_id="trace-dummy-003",
         agent_id="agent-test",
         params={"test": "data"},
     )
 
-    result = tool.run(context)
+    result = dummy_tool.run(context)
 
     assert result.tool_name == "dummy.echo"
-    assert result.tool_name == tool.name
-
-
-def test_dummy_tool_result_is_json_serializable():
-    """Test that result can be serialized to JSON."""
-    tool = DummyTool()
+    assert result.tool_name == dummy_tool.name
+
+
+@pytest.mark.parametrize(
+    "params, expected_ok, expected_error_code",
+    [
+        ({"test_key": "test_value", "number": 123}, True, None),
+        ({}, False, "EMPTY_PARAMS"),
+    ],
+    ids=["success", "error"],
+)
+def test_dummy_tool_result_is_json_serializable(
+    dummy_tool: DummyTool,
+    params: dict[str, Any],
+    expected_ok: bool,
+    expected_error_code: str | None,
+):
+    """Test that success and error results can be serialized to JSON."""
     context = ToolContext(
         trace_id="trace-dummy-004",
         agent_id="agent-test",
-        params={"test_key": "test_value", "number": 123},
+        params=params,
     )
 
-    result = tool.run(context)
+    result = dummy_tool.run(context)
 
     # Use Pydantic's model_dump to convert to dict
     result_dict = result.model_dump()
@@ -103,49 +119,28 @@ def test_dummy_tool_result_is_json_serializable():
 
     # Verify the JSON can be parsed back
     parsed = json.loads(json_str)
-    assert parsed["ok"] is True
+    assert parsed["ok"] is expected_ok
     assert parsed["trace_id"] == "trace-dummy-004"
     assert parsed["tool_name"] == "dummy.echo"
+    if expected_error_code is None:
+        assert parsed["error"] is None
+    else:
+        assert parsed["data"] is None
+        assert parsed["error"]["code"] == expected_error_code
 
 
-def test_dummy_tool_error_result_is_json_serializable():
-    """Test that error result can be serialized to JSON."""
-    tool = DummyTool()
-    context = ToolContext(
-        trace_id="trace-dummy-005",
-        agent_id="agent-test",
-        params={},
-    )
-
-    result = tool.run(context)
-
-    # Use Pydantic's model_dump to convert to dict
-    result_dict = result.model_dump()
-
-    # Ensure it's JSON-serializable
-    json_str = json.dumps(result_dict)
-    assert isinstance(json_str, str)
-
-    # Verify the JSON can be parsed back
-    parsed = json.loads(json_str)
-    assert parsed["ok"] is False
-    assert parsed["data"] is None
-    assert parsed["error"]["code"] == "EMPTY_PARAMS"
-
-
-def test_dummy_tool_properties():
+def test_dummy_tool_properties(dummy_tool: DummyTool):
     """Test that tool properties are correctly defined."""
-    tool = DummyTool()
-
-    assert tool.name == "dummy.echo"
-    assert tool.description == "Echo back provided params for testing and examples"
-    assert tool.version == "v1"
-    assert tool.enabled is True
+    assert dummy_tool.name == "dummy.echo"
+    assert (
+        dummy_tool.description == "Echo back provided params for testing and examples"
+    )
+    assert dummy_tool.version == "v1"
+    assert dummy_tool.enabled is True
 
 
-def test_dummy_tool_deterministic():
+def test_dummy_tool_deterministic(dummy_tool: DummyTool):
     """Test that tool produces consistent output for same input."""
-    tool = DummyTool()
     params = {"key": "value", "number": 42}
 
     context1 = ToolContext(
@@ -153,22 +148,21 @@ def test_dummy_tool_deterministic():
         agent_id="agent-test",
         params=params,
     )
-    result1 = tool.run(context1)
+    result1 = dummy_tool.run(context1)
 
     context2 = ToolContext(
         trace_id="trace-001",
         agent_id="agent-test",
         params=params,
     )
-    result2 = tool.run(context2)
+    result2 = dummy_tool.run(context2)
 
     # Results should be identical
     assert result1.model_dump() == result2.model_dump()
 
 
-def test_dummy_tool_with_various_param_types():
+def test_dummy_tool_with_various_param_types(dummy_tool: DummyTool):
     """Test that tool handles various data types in params."""
-    tool = DummyTool()
     params = {
         "string": "text",
         "integer": 123,
@@ -185,7 +179,7 @@ def test_dummy_tool_with_various_param_types():
         params=params,
     )
 
-    result = tool.run(context)
+    result = dummy_tool.run(context)
 
     assert result.ok is True
     assert result.data is not None
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 import uuid
 
+import pytest
+
 from apps.api.main import create_app
+from packages.core import reset_settings_cache
 from tests._requires import requires_httpx
 
 if TYPE_CHECKING:
@@ -13,10 +17,26 @@ if TYPE_CHECKING:
 pytestmark = [requires_httpx]
 
 
-def _client() -> TestClient:
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """One started test-env app for the module, with the test-only raise route.
+
+    Server exceptions are returned as responses so the 500 handler is visible.
+    The settings cache is reset around ``create_app()`` so the test env neither
+    depends on nor leaks into settings cached by other modules.
+    """
     from fastapi.testclient import TestClient
 
-    return TestClient(create_app())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("APP_ENV", "test")
+        reset_settings_cache()
+        try:
+            app = create_app()
+        finally:
+            reset_settings_cache()
+
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        yield test_client
 
 
 def _assert_error_response(
@@ -33,25 +53,19 @@ def _assert_error_response(
     uuid.UUID(request_id)
 
 
-def test_not_found_error_response():
-    with _client() as client:
-        response = client.get("/missing")
+def test_not_found_error_response(client: TestClient):
+    response = client.get("/missing")
 
     _assert_error_response(response, 404, "HTTP_404", "Not Found")
 
 
-def test_validation_error_response():
-    with _client() as client:
-        response = client.get("/echo-int", params={"value": "abc"})
+def test_validation_error_response(client: TestClient):
+    response = client.get("/echo-int", params={"value": "abc"})
 
     _assert_error_response(response, 422, "HTTP_422", "Validation Error")
 
 
-def test_internal_server_error_response(monkeypatch):
-    from fastapi.testclient import TestClient
-
-    monkeypatch.setenv("APP_ENV", "test")
-    with TestClient(create_app(), raise_server_exceptions=False) as client:
-        response = client.get("/__test__/raise")
+def test_internal_server_error_response(client: TestClient):
+    response = client.get("/__test__/raise")
 
     _assert_error_response(response, 500, "HTTP_500", "Internal Server Error")
@@ -1,5 +1,4 @@
 import logging
-from apps.api.main import app
 from packages.core import get_settings
 from packages.core.logging import RequestIdFormatter, get_logger
 from tests._requires import requires_httpx
@@ -31,7 +30,7 @@ def test_get_logger_configures_structured_handler():
 
 
 @requires_httpx
-def test_app_startup_initializes_logger_state():
+def test_app_startup_initializes_logger_state(app):
     from fastapi.testclient import TestClient
 
     with TestClient(app) as client:
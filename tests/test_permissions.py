@@ -17,6 +17,7 @@ from packages.core.tools.permissions import (
     Permission,
     PolicyDecision,
     ToolPermissions,
+    parse_permissions,
 )
 
 
@@ -37,6 +38,16 @@ class TestPermissionEnum:
         actual = {p.value for p in Permission}
         assert actual == expected
 
+    def test_parse_permissions(self):
+        """Test raw permission names are validated into enum members."""
+        assert parse_permissions(["READ_FS", "NET_HTTP"]) == [
+            Permission.READ_FS,
+            Permission.NET_HTTP,
+        ]
+        assert parse_permissions([]) == []
+        with pytest.raises(ValidationError):
+            parse_permissions(["NOT_A_PERMISSION"])
+
     def test_permission_enum_access(self):
         """Test permission enum can be accessed by name."""
         assert Permission.READ_FS.value == "READ_FS"
@@ -84,6 +95,32 @@ class TestToolPermissions:
         assert Permission.READ_FS in perms.required_permissions
         assert Permission.WRITE_FS in perms.optional_permissions
 
+    def test_tool_permissions_set_views(self):
+        """Test ToolPermissions exposes frozenset views of both lists."""
+        perms = ToolPermissions(
+            required_permissions=[Permission.READ_FS, Permission.NET_HTTP],
+            optional_permissions=[Permission.WRITE_FS],
+        )
+        assert perms.required_permissions_set == frozenset(
+            {Permission.READ_FS, Permission.NET_HTTP}
+        )
+        assert perms.optional_permissions_set == frozenset({Permission.WRITE_FS})
+
+    def test_tool_permissions_set_views_follow_copy(self):
+        """Test model_copy(update=...) rebuilds both frozenset views."""
+        perms = ToolPermissions(
+            required_permissions=[Permission.READ_FS],
+            optional_permissions=[Permission.WRITE_FS],
+        )
+        updated = perms.model_copy(
+            update={
+                "required_permissions": [Permission.EXEC_SHELL],
+                "optional_permissions": [],
+            }
+        )
+        assert updated.required_permissions_set == frozenset({Permission.EXEC_SHELL})
+        assert updated.optional_permissions_set == frozenset()
+
     def test_tool_permissions_immutable(self):
         """Test ToolPermissions is frozen/immutable."""
         perms = ToolPermissions(required_permissions=[Permission.READ_FS])
@@ -152,6 +189,47 @@ class TestAgentPolicy:
         assert len(data["allowed_permissions"]) == 2
         assert data["allowed_tools"] == ["deploy", "restart"]
 
+    def test_agent_policy_allowed_permissions_set(self):
+        """Test AgentPolicy precomputes a frozenset of allowed permissions."""
+        policy = AgentPolicy(
+            persona="core",
+            allowed_permissions=[Permission.NET_HTTP, Permission.READ_ENV],
+        )
+        assert policy.allowed_permissions_set == frozenset(
+            {Permission.NET_HTTP, Permission.READ_ENV}
+        )
+        assert "_allowed_permissions_set" not in policy.model_dump()
+
+    def test_agent_policy_allowed_tools_set(self):
+        """Test AgentPolicy precomputes a frozenset of allowlisted tools."""
+        policy = AgentPolicy(
+            persona="core",
+            allowed_tools=["web_search", "fetch_api", "web_search"],
+        )
+        assert policy.allowed_tools_set == frozenset({"web_search", "fetch_api"})
+        assert AgentPolicy(persona="core").allowed_tools_set == frozenset()
+
+    def test_agent_policy_allowed_permissions_set_follows_copy(self):
+        """Test model_copy(update=...) rebuilds the allowed permissions set."""
+        policy = AgentPolicy(
+            persona="core",
+            allowed_permissions=[Permission.READ_FS, Permission.EXEC_SHELL],
+        )
+        narrowed = policy.model_copy(
+            update={"allowed_permissions": [Permission.READ_FS]}
+        )
+        assert narrowed.allowed_permissions_set == frozenset({Permission.READ_FS})
+        assert policy.allowed_permissions_set == frozenset(
+            {Permission.READ_FS, Permission.EXEC_SHELL}
+        )
+
+    def test_agent_policy_allowed_tools_set_follows_copy(self):
+        """Test model_copy(update=...) drops removed tools from the lookup set."""
+        policy = AgentPolicy(persona="core", allowed_tools=["web_search", "shell"])
+        narrowed = policy.model_copy(update={"allowed_tools": ["web_search"]})
+        assert narrowed.allowed_tools_set == frozenset({"web_search"})
+        assert "shell" not in narrowed.allowed_tools_set
+
 
 class TestPolicyDecision:
     """Test the PolicyDecision schema."""
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING
 import logging
 import uuid
 
-from apps.api.main import app
 from tests._requires import requires_httpx
 
 if TYPE_CHECKING:
@@ -14,12 +13,6 @@ if TYPE_CHECKING:
 pytestmark = [requires_httpx]
 
 
-def _client() -> TestClient:
-    from fastapi.testclient import TestClient
-
-    return TestClient(app)
-
-
 def _find_request_log(caplog):
     for record in caplog.records:
         if "request completed" in record.getMessage():
@@ -27,12 +20,11 @@ def _find_request_log(caplog):
     raise AssertionError("request log not found")
 
 
-def test_request_logging_includes_fields(caplog):
+def test_request_logging_includes_fields(client: TestClient, caplog):
     caplog.set_level(logging.INFO)
     request_id = str(uuid.uuid4())
 
-    with _client() as client:
-        response = client.get("/", headers={"X-Request-ID": request_id})
+    response = client.get("/", headers={"X-Request-ID": request_id})
 
     assert response.status_code == 200
     record = _find_request_log(caplog)
@@ -44,11 +36,10 @@ def test_request_logging_includes_fields(caplog):
     assert record.request_id == request_id
 
 
-def test_not_found_request_is_logged_as_warning(caplog):
+def test_not_found_request_is_logged_as_warning(client: TestClient, caplog):
     caplog.set_level(logging.WARNING)
 
-    with _client() as client:
-        response = client.get("/missing")
+    response = client.get("/missing")
 
     assert response.status_code == 404
     record = _find_request_log(caplog)
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from apps.api.main import app
 from packages.core import get_settings
 from tests._requires import requires_httpx
 
@@ -14,13 +13,6 @@ if TYPE_CHECKING:
 pytestmark = [requires_httpx]
 
 
-@pytest.fixture
-def client() -> TestClient:
-    from fastapi.testclient import TestClient
-
-    return TestClient(app)
-
-
 def test_health_endpoint_returns_status(client: TestClient):
     """Ensure the health check reports expected fields."""
 
@@ -46,6 +46,11 @@ class TestShortTermMemory:
         m = ShortTermMemory()
         assert m.delete("x") is False
 
+    def test_no_instance_dict(self) -> None:
+        m = ShortTermMemory()
+        with pytest.raises(AttributeError):
+            m.extra = 1  # type: ignore[attr-defined]
+
     def test_keys_sorted(self) -> None:
         m = ShortTermMemory()
         m.set("z", 1)
@@ -7,9 +7,64 @@ from packages.core.tools.permissions import (
     AgentPolicy,
     Permission,
     ToolPermissions,
+    permission_mask,
 )
 
 
+class TestPermissionMask:
+    """Tests for the bitmask view used by the checker."""
+
+    def test_each_permission_has_distinct_bit(self) -> None:
+        bits = [p.bit for p in Permission]
+        assert len(set(bits)) == len(bits)
+        assert all(bit & (bit - 1) == 0 for bit in bits)
+
+    def test_policy_and_tool_masks(self) -> None:
+        policy = AgentPolicy(
+            persona="core",
+            allowed_permissions=[Permission.READ_FS, Permission.NET_HTTP],
+        )
+        tool_perms = ToolPermissions(
+            required_permissions=[Permission.NET_HTTP, Permission.NET_HTTP],
+        )
+        assert policy.allowed_permissions_mask == (
+            Permission.READ_FS.bit | Permission.NET_HTTP.bit
+        )
+        assert tool_perms.required_permissions_mask == Permission.NET_HTTP.bit
+        assert permission_mask([]) == 0
+
+    def test_masks_follow_model_copy_update(self) -> None:
+        policy = AgentPolicy(
+            persona="core",
+            allowed_permissions=[Permission.READ_FS, Permission.EXEC_SHELL],
+        )
+        narrowed = policy.model_copy(
+            update={"allowed_permissions": [Permission.READ_FS]}
+        )
+        tool_perms = ToolPermissions(required_permissions=[Permission.READ_FS])
+        widened = tool_perms.model_copy(
+            update={"required_permissions": [Permission.EXEC_SHELL]}
+        )
+
+        assert narrowed.allowed_permissions_mask == Permission.READ_FS.bit
+        assert widened.required_permissions_mask == Permission.EXEC_SHELL.bit
+        assert policy.allowed_permissions_mask == (
+            Permission.READ_FS.bit | Permission.EXEC_SHELL.bit
+        )
+
+        shell = ToolPermissions(required_permissions=[Permission.EXEC_SHELL])
+        decision = check_tool_permission(narrowed, shell, "shell")
+        assert decision.allowed is False
+        assert "EXEC_SHELL" in decision.reason
+
+    def test_allowlist_follows_model_copy_update(self) -> None:
+        policy = AgentPolicy(persona="core", allowed_tools=["web_search", "shell"])
+        narrowed = policy.model_copy(update={"allowed_tools": ["web_search"]})
+        decision = check_tool_permission(narrowed, ToolPermissions(), "shell")
+        assert decision.allowed is False
+        assert "not in the allowlist" in decision.reason
+
+
 class TestCheckToolPermission:
     """Tests for the check_tool_permission function."""
 
@@ -103,6 +158,21 @@ class TestCheckToolPermission:
         assert "EXEC_SHELL" in result.reason
         assert "WRITE_FS" in result.reason
 
+    def test_deny_reason_lists_missing_permissions_sorted(self) -> None:
+        policy = AgentPolicy(
+            persona="docs",
+            allowed_permissions=[Permission.READ_FS],
+        )
+        tool_perms = ToolPermissions(
+            required_permissions=[
+                Permission.WRITE_FS,
+                Permission.READ_FS,
+                Permission.EXEC_SHELL,
+            ],
+        )
+        result = check_tool_permission(policy, tool_perms, "dangerous")
+        assert result.reason == "Missing required permissions: EXEC_SHELL, WRITE_FS"
+
     # ── ordering: allowlist checked before permissions ─────────────────
 
     def test_allowlist_checked_before_permissions(self) -> None:
@@ -134,6 +204,39 @@ class TestCheckToolPermission:
         result = check_tool_permission(policy, tool_perms, "api_call")
         assert result.allowed is True
 
+    # ── memoization ───────────────────────────────────────────────────
+
+    def test_repeated_check_reuses_decision(self) -> None:
+        policy = AgentPolicy(
+            persona="core",
+            allowed_permissions=[Permission.NET_HTTP],
+        )
+        tool_perms = ToolPermissions(required_permissions=[Permission.NET_HTTP])
+        first = check_tool_permission(policy, tool_perms, "api_call")
+        again = check_tool_permission(
+            AgentPolicy(persona="core", allowed_permissions=[Permission.NET_HTTP]),
+            ToolPermissions(required_permissions=[Permission.NET_HTTP]),
+            "api_call",
+        )
+        assert again is first
+
+    def test_memoized_decision_not_reused_for_narrowed_copy(self) -> None:
+        policy = AgentPolicy(
+            persona="core",
+            allowed_permissions=[Permission.READ_FS, Permission.EXEC_SHELL],
+            allowed_tools=["shell", "reader"],
+        )
+        shell = ToolPermissions(required_permissions=[Permission.EXEC_SHELL])
+        assert check_tool_permission(policy, shell, "shell").allowed is True
+
+        no_shell = policy.model_copy(
+            update={"allowed_permissions": [Permission.READ_FS]}
+        )
+        no_tool = policy.model_copy(update={"allowed_tools": ["reader"]})
+        assert check_tool_permission(no_shell, shell, "shell").allowed is False
+        assert check_tool_permission(no_tool, shell, "shell").allowed is False
+        assert check_tool_permission(policy, shell, "shell").allowed is True
+
     # ── persona integration examples ──────────────────────────────────
 
     def test_infra_persona_allows_shell(self) -> None:
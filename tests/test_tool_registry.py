@@ -218,6 +218,21 @@ class TestInMemoryToolRegistry:
         reg2 = registry.register(spec)
 
         assert reg1 == reg2
+        assert reg2 is reg1
+
+    def test_register_equal_spec_copy_returns_existing(self):
+        """Test that an equal but distinct spec object returns existing registration."""
+        registry = InMemoryToolRegistry()
+        spec = ToolSpec(
+            tool_name="example",
+            version="1.0.0",
+            input_schema={"a": "string"},
+            output_schema={"b": "number"},
+        )
+        reg1 = registry.register(spec)
+        reg2 = registry.register(spec.model_copy(deep=True))
+
+        assert reg2 is reg1
 
     def test_register_different_version_overwrites(self):
         """Test that registering with different version overwrites."""
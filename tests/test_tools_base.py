@@ -247,6 +247,27 @@ def test_tool_result_with_error_serialization():
     assert result_dict["error"]["retryable"] is True
 
 
+def test_tool_result_build_matches_constructor():
+    """Test that trusted build() produces the same model as validated construction."""
+    error = ToolError.build(code="BUILD_ERROR", message="Built without validation")
+    built = ToolResult.build(
+        ok=False,
+        error=error,
+        trace_id="trace-build",
+        tool_name="build_tool",
+    )
+    validated = ToolResult(
+        ok=False,
+        data=None,
+        error=ToolError(code="BUILD_ERROR", message="Built without validation"),
+        trace_id="trace-build",
+        tool_name="build_tool",
+    )
+
+    assert built == validated
+    assert built.model_dump_json() == validated.model_dump_json()
+
+
 def test_tool_context_default_values():
     """Test that ToolContext uses default values correctly."""
     context = ToolContext(
@@ -261,6 +282,15 @@ def test_tool_context_default_values():
     assert context.metadata == {}
 
 
+def test_tool_context_default_dicts_not_shared():
+    """Test that default params/metadata are not shared between instances."""
+    first = ToolContext(trace_id="trace-a", agent_id="agent")
+    second = ToolContext(trace_id="trace-b", agent_id="agent")
+
+    assert first.params is not second.params
+    assert first.metadata is not second.metadata
+
+
 def test_tool_context_with_all_fields():
     """Test ToolContext with all fields populated."""
     context = ToolContext(
@@ -1,6 +1,6 @@
 import pytest
 
-from packages.core.version import VersionInfo, get_version_info
+from packages.core.version import VersionInfo, get_version_info, reset_version_cache
 
 
 @pytest.fixture(autouse=True)
@@ -92,3 +92,16 @@ def test_new_variables_take_precedence_over_legacy(monkeypatch: pytest.MonkeyPat
     assert version_info.version == "2.0.0"
     assert version_info.git_sha == "f00ba7"
     assert version_info.build_time == "2025-01-01T00:00:00Z"
+
+
+def test_version_info_is_cached_until_reset(monkeypatch: pytest.MonkeyPatch):
+    """Environment is read once; reset_version_cache picks up new values."""
+
+    monkeypatch.setenv("FLOWBIZ_VERSION", "1.0.0")
+    first = get_version_info()
+
+    monkeypatch.setenv("FLOWBIZ_VERSION", "2.0.0")
+    assert get_version_info() is first
+
+    reset_version_cache()
+    assert get_version_info().version == "2.0.0"